@@ -5,13 +5,276 @@ This module provides helper functions to visualize graph data from Python
 notebooks directly in the Graph Explorer web application.
 """
 
+import base64
+import gzip
 import json
+import os
+import secrets
+import subprocess
+import sys
+import threading
+import time
 import urllib.parse
 import webbrowser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Optional, Union, Dict, Any, List
 import pandas as pd
 import numpy as np
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values that neither orjson nor stdlib json handle natively."""
+    # Timestamps (and other dates) are sent as ISO 8601 strings
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        # OPT_NON_STR_KEYS stringifies non-str keys (e.g. integer column labels)
+        # the same way json.dumps does
+        return orjson.dumps(
+            obj,
+            default=_json_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(obj, default=_json_default).encode("utf-8")
+
+# Standardized column names produced by process_parquet_for_graph
+_GRAPH_COLUMNS = ["Source", "Target", "RelationshipType"]
+
+def _column_values(series: pd.Series) -> Union[np.ndarray, list]:
+    """Return a column's values in a form _dumps can serialize, with missing values as None."""
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in "biuf":
+        if orjson is not None:
+            # orjson serializes NumPy arrays directly and writes NaN as null
+            return series.to_numpy()
+        # stdlib json would emit bare NaN, which is not valid JSON
+        values = series.tolist()
+        if dtype.kind == "f":
+            values = [None if v != v else v for v in values]
+        return values
+    
+    # Object, datetime and extension columns can hold pd.NA or NaT, which no
+    # serializer accepts, so missing values are replaced with None
+    return series.astype(object).where(series.notna(), None).tolist()
+
+def _isin(arr: np.ndarray, values: Any) -> np.ndarray:
+    """Membership test for a NumPy array, matching NaN the way Series.isin does."""
+    if arr.dtype.kind in "fO":
+        # np.isin never matches NaN, since NaN != NaN
+        return pd.Series(arr, copy=False).isin(list(values)).to_numpy()
+    return np.isin(arr, list(values))
+
+# Vectorized implementations of the filter operators supported by
+# process_parquet_for_graph, applied to a column's NumPy array
+_OPS = {
+    "==": np.equal,
+    "!=": np.not_equal,
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "<": np.less,
+    "<=": np.less_equal,
+    "in": _isin,
+    "not in": lambda arr, val: ~_isin(arr, val),
+}
+
+# The same operators applied to a pandas Series, for dtypes (categoricals,
+# datetimes, extension types) whose comparison semantics NumPy doesn't know
+_SERIES_OPS = {
+    "==": pd.Series.eq,
+    "!=": pd.Series.ne,
+    ">": pd.Series.gt,
+    ">=": pd.Series.ge,
+    "<": pd.Series.lt,
+    "<=": pd.Series.le,
+    "in": lambda series, val: series.isin(list(val)),
+    "not in": lambda series, val: ~series.isin(list(val)),
+}
+
+def _filter_values(series: pd.Series) -> Union[np.ndarray, pd.Series]:
+    """Return the values a filter is evaluated on: a NumPy array for plain
+    numeric, bool and object columns, otherwise the Series itself."""
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biufO":
+        return series.to_numpy()
+    return series
+
+def _filter_mask(values: Union[np.ndarray, pd.Series], op: str, val: Any) -> np.ndarray:
+    """Evaluate one filter condition as a boolean NumPy array."""
+    if isinstance(values, pd.Series):
+        # Missing values never match, as with boolean indexing in pandas
+        return _SERIES_OPS[op](values, val).to_numpy(dtype=bool, na_value=False)
+    try:
+        return _OPS[op](values, val)
+    except TypeError:
+        # NumPy has no loop for this dtype and value (e.g. an int column
+        # compared with a string); pandas decides whether that is an error
+        return _filter_mask(pd.Series(values, copy=False), op, val)
+
+def _iter_filters(filters: Dict[str, Any]):
+    """Yield (column, operator, value) for each condition in a filters dict."""
+    for col, condition in filters.items():
+        # A list applies several operator conditions to the same column
+        if isinstance(condition, list):
+            if not all(isinstance(c, dict) and "operator" in c for c in condition):
+                raise ValueError(
+                    f"Filter list for column {col!r} must contain only "
+                    "{'operator': ..., 'value': ...} conditions; use the 'in' operator "
+                    "to match any of several values"
+                )
+            conditions = condition
+        else:
+            conditions = [condition]
+        for cond in conditions:
+            if isinstance(cond, dict) and "operator" in cond:
+                # Handle operators like >, <, >=, etc.
+                op = cond["operator"]
+                val = cond["value"]
+            else:
+                # Simple equality filter
+                op = "=="
+                val = cond
+            
+            if op not in _OPS:
+                raise ValueError(f"Unsupported operator: {op}")
+            if op in ("in", "not in") and isinstance(val, str):
+                raise TypeError(
+                    f"Filter value for {op!r} on column {col!r} must be a list of values, not a str"
+                )
+            yield col, op, val
+
+# Comparisons (and column dtypes) that can be fused into a single pass over
+# the data
+_FUSED_OPS = {"==", "!=", ">", ">=", "<", "<="}
+_FUSED_DTYPES = {np.dtype(t) for t in ("int32", "int64", "float32", "float64")}
+_INT64_RANGE = (np.iinfo(np.int64).min, np.iinfo(np.int64).max)
+
+def _is_fusable(arr: Union[np.ndarray, pd.Series], op: str, val: Any) -> bool:
+    """Whether a filter can be fused with others and give the same result as _OPS."""
+    if (op not in _FUSED_OPS or not isinstance(arr, np.ndarray)
+            or arr.dtype not in _FUSED_DTYPES or isinstance(val, bool)):
+        return False
+    if isinstance(val, int):
+        # numexpr can't represent integers outside the int64 range
+        return _INT64_RANGE[0] <= val <= _INT64_RANGE[1]
+    return isinstance(val, float)
+
+def _fused_value(arr: np.ndarray, val: Any) -> Any:
+    """Cast a filter value the way NumPy does when comparing it with arr."""
+    # NumPy compares float32 columns with a Python float in float32, so the
+    # value is narrowed to match instead of the column being widened
+    if arr.dtype.kind == "f":
+        return arr.dtype.type(val)
+    return val
+
+def _numexpr_mask(numeric_filters: List[tuple]) -> np.ndarray:
+    """Evaluate (array, operator, value) comparisons ANDed together in one numexpr pass."""
+    local_dict = {}
+    terms = []
+    for i, (arr, op, val) in enumerate(numeric_filters):
+        local_dict[f"c{i}"] = arr
+        local_dict[f"v{i}"] = _fused_value(arr, val)
+        terms.append(f"(c{i} {op} v{i})")
+    return numexpr.evaluate(" & ".join(terms), local_dict=local_dict)
+
+def _open_browser(url: str) -> None:
+    """Open url in the default browser without waiting for the browser to start."""
+    try:
+        if sys.platform == "win32":
+            os.startfile(url)
+            return
+        opener = "open" if sys.platform == "darwin" else "xdg-open"
+        subprocess.Popen(
+            [opener, url],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+    except OSError:
+        # No system opener available; let webbrowser find a browser instead
+        webbrowser.open(url)
+
+def _build_data_url(app_url: str, json_bytes: bytes) -> str:
+    """Build an app URL carrying the serialized graph data, warning if it is very long."""
+    # Gzip-compressed, URL-safe base64 encoded data is much shorter than
+    # percent-encoded JSON and cheaper to produce
+    encoded_data = base64.urlsafe_b64encode(gzip.compress(json_bytes)).decode("ascii").rstrip("=")
+    url = f"{app_url}/?gzdata={encoded_data}"
+    
+    # If URL is too long (>2000 chars), warn the user
+    if len(url) > 2000:
+        print(f"Warning: URL length is {len(url)} characters, which may exceed browser limits.")
+        print("Consider using method='server', method='js' or reducing the size of your dataset.")
+    
+    return url
+
+# How long a handed-off payload stays available, in seconds, so the app tab
+# can be reloaded (or fetch twice under React.StrictMode) before it expires
+_HANDOFF_TTL = 30 * 60
+
+# Payloads waiting to be fetched by the app through the local handoff server,
+# keyed by a random token, with the time.monotonic() deadline they expire at
+_handoff_payloads: Dict[str, tuple] = {}
+_handoff_server: Optional[ThreadingHTTPServer] = None
+_handoff_lock = threading.Lock()
+
+def _expire_handoff_payloads() -> None:
+    """Drop expired payloads. Must be called with _handoff_lock held."""
+    now = time.monotonic()
+    for token in [t for t, (_, expires) in _handoff_payloads.items() if expires <= now]:
+        del _handoff_payloads[token]
+
+class _HandoffHandler(BaseHTTPRequestHandler):
+    """Serve handed-off payloads to the Graph Explorer app until they expire."""
+    
+    def do_GET(self):
+        with _handoff_lock:
+            _expire_handoff_payloads()
+            entry = _handoff_payloads.get(self.path.lstrip("/"))
+        if entry is None:
+            self.send_error(404)
+            return
+        
+        body = entry[0]
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        # The app is served from a different origin (app_url)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        # Keep request logs out of notebook output
+        pass
+
+def _handoff_data_url(json_bytes: bytes) -> str:
+    """Serve json_bytes from a local HTTP server and return the URL to fetch it from."""
+    global _handoff_server
+    with _handoff_lock:
+        if _handoff_server is None:
+            # Bind to an ephemeral loopback port, served from a daemon thread
+            _handoff_server = ThreadingHTTPServer(("127.0.0.1", 0), _HandoffHandler)
+            threading.Thread(target=_handoff_server.serve_forever, daemon=True).start()
+        # Payloads that were never fetched are cleaned up here as well
+        _expire_handoff_payloads()
+        token = secrets.token_urlsafe(16)
+        _handoff_payloads[token] = (json_bytes, time.monotonic() + _HANDOFF_TTL)
+    host, port = _handoff_server.server_address[:2]
+    return f"http://{host}:{port}/{token}"
+
 def visualize_graph(df: pd.DataFrame, 
                     source_col: Optional[str] = None, 
                     target_col: Optional[str] = None, 
@@ -23,10 +286,12 @@ def visualize_graph(df: pd.DataFrame,
     Visualize a pandas DataFrame as a network graph in the Graph Explorer application.
     
     This function allows you to visualize relationship data from your pandas DataFrame
-    directly in the Graph Explorer web application. It supports two methods:
+    directly in the Graph Explorer web application. It supports three methods:
     
-    1. URL method: Embeds data in a URL and opens it in a browser
-    2. JavaScript method: Uses JavaScript to send data to an already open app instance
+    1. URL method: Embeds gzip-compressed data in a URL and opens it in a browser
+    2. Server method: Serves the data from a local HTTP server and opens the app
+       with a URL pointing to it, so large datasets never go through the URL
+    3. JavaScript method: Uses JavaScript to send data to an already open app instance
        (only works in Jupyter notebooks)
     
     Parameters:
@@ -48,7 +313,8 @@ def visualize_graph(df: pd.DataFrame,
     
     method : str, default="url"
         Method to use for passing data to the application:
-        - "url": Encode data in URL and open in browser
+        - "url": Compress and encode data in URL and open in browser
+        - "server": Serve data from a local HTTP server for the app to fetch
         - "js": Use JavaScript to send data to open app (Jupyter only)
     
     jupyter_display : bool, default=True
@@ -58,7 +324,8 @@ def visualize_graph(df: pd.DataFrame,
     Returns:
     --------
     str
-        URL that can be used to view the visualization
+        URL that can be used to view the visualization. When the data is sent
+        with method="js", this is app_url itself.
     
     Examples:
     ---------
@@ -78,66 +345,76 @@ def visualize_graph(df: pd.DataFrame,
     >>> # Or specify column names explicitly
     >>> visualize_graph(df, source_col="source", target_col="target", edge_type_col="relationship")
     """
-    # Make a copy to avoid modifying the original
-    data_df = df.copy()
-    
-    # Handle NaN values by converting to None
-    data_df = data_df.replace({np.nan: None})
-    
     # Convert DataFrame to JSON-compatible format
-    # Use pandas' to_dict method for records orientation
-    # This creates a list of dictionaries, one per row
-    records = data_df.to_dict(orient='records')
-    
-    # Serialize to JSON string
-    json_data = json.dumps(records)
-    
-    # Generate the URL with encoded data
-    encoded_data = urllib.parse.quote(json_data)
-    url = f"{app_url}/?data={encoded_data}"
+    # df is only read here, so the columns are taken from it directly
+    cols = list(df.columns)
+    if cols == _GRAPH_COLUMNS:
+        # Graph data from process_parquet_for_graph: send one array per column,
+        # so the keys are not repeated for every row
+        payload = {"cols": cols, "data": [_column_values(series) for _, series in df.items()]}
+    else:
+        # Extract each column once and zip them into one record per row,
+        # rather than letting to_dict box every cell individually
+        arrs = [_column_values(series) for _, series in df.items()]
+        payload = [dict(zip(cols, row)) for row in zip(*arrs)]
     
-    # If URL is too long (>2000 chars), warn the user
-    if len(url) > 2000:
-        print(f"Warning: URL length is {len(url)} characters, which may exceed browser limits.")
-        print("Consider using method='js' or reducing the size of your dataset.")
+    # Serialize to JSON bytes once (orjson if available, stdlib json otherwise)
+    # Every method reuses these bytes
+    json_bytes = _dumps(payload)
     
     # For JavaScript method (useful in Jupyter)
     if method == "js" and jupyter_display:
         try:
             from IPython.display import display, HTML
             
+            # Embed the data as a base64 data URL that the browser decodes natively,
+            # rather than as a large JavaScript literal that has to be lexed
+            b64_data = base64.b64encode(json_bytes).decode("ascii")
             js_code = f"""
             <script>
-              var graphData = {json_data};
               var graphWindow = window.open('{app_url}', '_blank');
               
-              // Wait for the window to load, then send data
-              if (graphWindow) {{
-                graphWindow.onload = function() {{
-                  graphWindow.loadGraphData(graphData);
-                }};
-                
-                // Fallback if onload doesn't trigger
-                setTimeout(function() {{
-                  try {{
-                    graphWindow.loadGraphData(graphData);
-                  }} catch(e) {{
-                    console.error('Failed to send data to graph window', e);
+              fetch('data:application/json;base64,{b64_data}')
+                .then(function(response) {{ return response.json(); }})
+                .then(function(graphData) {{
+                  // Wait for the window to load, then send data
+                  if (graphWindow) {{
+                    graphWindow.onload = function() {{
+                      graphWindow.loadGraphData(graphData);
+                    }};
+                    
+                    // Fallback if onload doesn't trigger
+                    setTimeout(function() {{
+                      try {{
+                        graphWindow.loadGraphData(graphData);
+                      }} catch(e) {{
+                        console.error('Failed to send data to graph window', e);
+                      }}
+                    }}, 1000);
                   }}
-                }}, 1000);
-              }}
+                }});
             </script>
             """
             
             display(HTML(js_code))
-            print(f"Sending data to Graph Explorer ({len(records)} records)")
+            print(f"Sending data to Graph Explorer ({len(df)} records)")
+            
+            # The data goes straight to the app window, so no data URL is needed
+            return app_url
             
         except ImportError:
             print("IPython display module not available. Falling back to URL method.")
-            webbrowser.open(url)
-    else:
-        # URL method - open in browser
-        webbrowser.open(url)
+    
+    if method == "server":
+        # Server method - the app fetches the data from a local handoff server
+        data_url = _handoff_data_url(json_bytes)
+        url = f"{app_url}/?dataUrl={urllib.parse.quote(data_url, safe='')}"
+        _open_browser(url)
+        return url
+    
+    # URL method - open in browser
+    url = _build_data_url(app_url, json_bytes)
+    _open_browser(url)
     
     return url
 
@@ -175,8 +452,10 @@ def process_parquet_for_graph(
         Default relationship type to use if edge_type_col is not provided
     
     filters : dict, optional
-        Dictionary of column:value pairs to filter the DataFrame
+        Dictionary of column:value pairs to filter the DataFrame. A list of
+        operator conditions applies all of them to the same column.
         Example: {"category": "finance", "weight": {"operator": ">", "value": 0.5}}
+        Example: {"weight": [{"operator": ">", "value": 0.5}, {"operator": "<", "value": 2}]}
     
     max_records : int, default=1000
         Maximum number of records to include in the visualization.
@@ -209,63 +488,223 @@ def process_parquet_for_graph(
     >>> # Visualize the processed data
     >>> visualize_graph(graph_data)
     """
-    # Make a copy to avoid modifying the original
-    result_df = df.copy()
+    # Fast path: nothing to filter, truncate or fill in, so just select and relabel
+    if not filters and edge_type_col and df.shape[0] <= max_records:
+        result_df = df[[source_col, target_col, edge_type_col]]
+        result_df.columns = _GRAPH_COLUMNS
+        return result_df
     
     # Apply filters if provided
+    # All predicates are combined into a single boolean mask over the column
+    # arrays, so the DataFrame is only sliced once instead of once per filter
     if filters:
-        for col, condition in filters.items():
-            if isinstance(condition, dict) and "operator" in condition:
-                # Handle operators like >, <, >=, etc.
-                op = condition["operator"]
-                val = condition["value"]
-                
-                if op == ">":
-                    result_df = result_df[result_df[col] > val]
-                elif op == ">=":
-                    result_df = result_df[result_df[col] >= val]
-                elif op == "<":
-                    result_df = result_df[result_df[col] < val]
-                elif op == "<=":
-                    result_df = result_df[result_df[col] <= val]
-                elif op == "!=":
-                    result_df = result_df[result_df[col] != val]
-                elif op == "in":
-                    result_df = result_df[result_df[col].isin(val)]
-                elif op == "not in":
-                    result_df = result_df[~result_df[col].isin(val)]
-                else:
-                    raise ValueError(f"Unsupported operator: {op}")
+        mask = np.ones(len(df), dtype=bool)
+        numeric_filters = []
+        any_rows = True
+        # Column values are extracted once, even if several filters use the same column
+        col_cache: Dict[str, Union[np.ndarray, pd.Series]] = {}
+        
+        # Validate every operator and column up front, so an unsupported
+        # operator or missing column raises even if earlier filters end up
+        # excluding every row
+        conditions = list(_iter_filters(filters))
+        for col, _, _ in conditions:
+            if col not in df.columns:
+                raise KeyError(col)
+        
+        for col, op, val in conditions:
+            # Once every row is excluded the remaining filters can't change the result
+            if not any_rows:
+                break
+            
+            arr = col_cache.get(col)
+            if arr is None:
+                arr = col_cache[col] = _filter_values(df[col])
+            
+            if _is_fusable(arr, op, val):
+                # Defer numeric comparisons so they can be evaluated together
+                numeric_filters.append((arr, op, val))
             else:
-                # Simple equality filter
-                result_df = result_df[result_df[col] == condition]
+                mask &= _filter_mask(arr, op, val)
+                any_rows = mask.any()
+        
+        if not any_rows:
+            # The other filters already excluded every row
+            numeric_filters = []
+        
+        # Fuse compound numeric predicates into a single pass when numexpr is
+        # available
+        if numexpr is not None and len(numeric_filters) > 1:
+            mask &= _numexpr_mask(numeric_filters)
+        else:
+            for arr, op, val in numeric_filters:
+                mask &= _OPS[op](arr, val)
+                if not mask.any():
+                    break
+        
+        # Positions of the rows that pass every filter
+        rows = np.flatnonzero(mask)
+        num_rows = len(rows)
+    else:
+        rows = None
+        num_rows = len(df)
     
     # Extract only the columns we need
     needed_cols = [source_col, target_col]
     if edge_type_col:
         needed_cols.append(edge_type_col)
     
-    result_df = result_df[needed_cols]
+    # Limit to max_records before selecting rows, so at most max_records
+    # rows are ever copied regardless of the size of the input
+    if num_rows > max_records:
+        print(f"Warning: Dataset truncated from {num_rows} to {max_records} records.")
+    
+    # Resolve only the needed labels, so duplicate labels elsewhere in the frame
+    # don't matter; get_loc raises KeyError for a missing column
+    col_positions = []
+    for col in needed_cols:
+        pos = df.columns.get_loc(col)
+        if not isinstance(pos, int):
+            raise ValueError(f"Column {col!r} is not unique")
+        col_positions.append(pos)
+    
+    # Select rows and columns in one step, so only the needed columns of the
+    # kept rows are copied. The input is never modified, and this already
+    # produces a new DataFrame, so no defensive copy is needed
+    if rows is None:
+        result_df = df.iloc[:max_records, col_positions]
+    else:
+        result_df = df.iloc[rows[:max_records], col_positions]
     
-    # Limit to max_records
-    if len(result_df) > max_records:
-        print(f"Warning: Dataset truncated from {len(result_df)} to {max_records} records.")
-        result_df = result_df.head(max_records)
+    # Standardize column names to match expected format
+    # needed_cols is always ordered source, target(, edge type), so the
+    # names can be assigned positionally instead of going through rename()
+    result_df.columns = _GRAPH_COLUMNS[:len(needed_cols)]
     
     # If no edge_type_col was provided, add a default one
+    # A categorical stores one int8 code per row instead of a full object column
     if not edge_type_col:
-        result_df["relationship_type"] = edge_type_default
-        edge_type_col = "relationship_type"
-    
-    # Standardize column names to match expected format
-    result_df = result_df.rename(columns={
-        source_col: "Source",
-        target_col: "Target",
-        edge_type_col: "RelationshipType"
-    })
+        result_df["RelationshipType"] = pd.Categorical.from_codes(
+            np.zeros(len(result_df), dtype=np.int8), categories=[edge_type_default]
+        )
     
     return result_df
 
+def _to_dataset_filter(filters: Optional[Dict[str, Any]], schema):
+    """Translate a process_parquet_for_graph filters dict into a pyarrow.dataset expression."""
+    if not filters:
+        return None
+    
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    
+    expr = None
+    for col, op, val in _iter_filters(filters):
+        field = ds.field(col)
+        if op in _FUSED_OPS and isinstance(val, float) and col in schema.names:
+            # Arrow would widen a float32 column to compare it with a Python
+            # float; compare in the column's own type, as NumPy does
+            if schema.field(col).type == pa.float32():
+                val = pa.scalar(val, type=pa.float32())
+        if op == "==":
+            term = field == val
+        elif op == "!=":
+            term = field != val
+        elif op == ">":
+            term = field > val
+        elif op == ">=":
+            term = field >= val
+        elif op == "<":
+            term = field < val
+        elif op == "<=":
+            term = field <= val
+        elif op == "in":
+            term = field.isin(list(val))
+        else:
+            term = ~field.isin(list(val))
+        
+        # Arrow drops rows where a comparison is null, but the DataFrame path
+        # keeps missing values for != and not in, so match that explicitly
+        if op in ("!=", "not in"):
+            term = term | field.is_null()
+        
+        expr = term if expr is None else expr & term
+    return expr
+
+def process_parquet_for_graph_path(
+    path: str,
+    source_col: str,
+    target_col: str,
+    edge_type_col: Optional[str] = None,
+    edge_type_default: str = "connection",
+    filters: Optional[Dict[str, Any]] = None,
+    max_records: int = 1000
+) -> pd.DataFrame:
+    """
+    Read a Parquet file and process it into a format suitable for graph visualization.
+    
+    Like process_parquet_for_graph, but reads the file itself so that filters,
+    column selection and max_records are pushed down into the Parquet scan. Row
+    groups that cannot match the filters are skipped, only the needed columns are
+    decoded, and scanning stops once enough matching rows have been read, so the
+    whole file never has to be loaded into memory.
+    
+    Unlike process_parquet_for_graph, the truncation warning cannot report how
+    many rows matched in total, since the scan stops early.
+    
+    Parameters:
+    -----------
+    path : str
+        Path to the Parquet file (or directory of Parquet files)
+    
+    source_col, target_col, edge_type_col, edge_type_default, filters, max_records
+        Same as for process_parquet_for_graph
+    
+    Returns:
+    --------
+    pandas.DataFrame
+        A DataFrame formatted for graph visualization, containing only the
+        columns needed for the visualization.
+    
+    Examples:
+    ---------
+    >>> from graph_explorer import process_parquet_for_graph_path, visualize_graph
+    >>> 
+    >>> graph_data = process_parquet_for_graph_path(
+    >>>     "large_dataset.parquet",
+    >>>     source_col="user_id",
+    >>>     target_col="friend_id",
+    >>>     filters={"connection_strength": {"operator": ">", "value": 0.7}},
+    >>>     max_records=500
+    >>> )
+    >>> visualize_graph(graph_data)
+    """
+    import pyarrow.dataset as ds
+    
+    # Only read the columns we need
+    needed_cols = [source_col, target_col]
+    if edge_type_col:
+        needed_cols.append(edge_type_col)
+    
+    # Stop scanning once one row more than max_records has matched; the extra
+    # row only tells us whether the result was truncated
+    dataset = ds.dataset(path, format="parquet")
+    table = dataset.head(max_records + 1, columns=needed_cols, filter=_to_dataset_filter(filters, dataset.schema))
+    
+    if table.num_rows > max_records:
+        print(f"Warning: Dataset truncated to {max_records} records.")
+        table = table.slice(0, max_records)
+    
+    # Filters and truncation have already been applied by the scan
+    return process_parquet_for_graph(
+        table.to_pandas(),
+        source_col=source_col,
+        target_col=target_col,
+        edge_type_col=edge_type_col,
+        edge_type_default=edge_type_default,
+        max_records=max_records
+    )
+
 # Example usage in a notebook
 if __name__ == "__main__":
     # This code only runs when the module is executed directly
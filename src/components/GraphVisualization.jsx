@@ -3,6 +3,15 @@ import * as d3 from 'd3';
 import Papa from 'papaparse';
 import './GraphVisualization.css';
 
+// Decode a gzip-compressed, URL-safe base64 payload (as produced by the Python helper)
+const decodeGzipPayload = async (payload) => {
+  const base64 = payload.replace(/-/g, '+').replace(/_/g, '/');
+  const padded = base64 + '='.repeat((4 - (base64.length % 4)) % 4);
+  const bytes = Uint8Array.from(atob(padded), c => c.charCodeAt(0));
+  const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+  return JSON.parse(await new Response(stream).text());
+};
+
 const GraphVisualization = () => {
   const [file, setFile] = useState(null);
   const [data, setData] = useState(null);
@@ -94,6 +103,19 @@ const GraphVisualization = () => {
         }
       }
       
+      // Rebuild rows from a columnar payload ({cols: [...], data: [[...], ...]})
+      if (parsedData && Array.isArray(parsedData.cols) && Array.isArray(parsedData.data)) {
+        const { cols, data: colData } = parsedData;
+        const rowCount = colData.length > 0 ? colData[0].length : 0;
+        parsedData = Array.from({ length: rowCount }, (_, i) => {
+          const row = {};
+          cols.forEach((col, j) => {
+            row[col] = colData[j][i];
+          });
+          return row;
+        });
+      }
+      
       // Check if we have an array of objects
       if (!Array.isArray(parsedData)) {
         throw new Error("Data must be an array of objects");
@@ -129,8 +151,26 @@ const GraphVisualization = () => {
     
     // Check for URL parameters with data
     const urlParams = new URLSearchParams(window.location.search);
+    const dataUrlParam = urlParams.get('dataUrl');
+    const gzDataParam = urlParams.get('gzdata');
     const dataParam = urlParams.get('data');
-    if (dataParam) {
+    if (dataUrlParam) {
+      // Payload handed off through the Python helper's local server
+      fetch(dataUrlParam)
+        .then(response => {
+          if (!response.ok) {
+            throw new Error(`HTTP ${response.status}`);
+          }
+          return response.json();
+        })
+        .then(decodedData => loadFromJsonPayload(decodedData))
+        .catch(err => console.error("Failed to load data from URL parameter", err));
+    } else if (gzDataParam) {
+      // Compressed payload from the Python helper
+      decodeGzipPayload(gzDataParam)
+        .then(decodedData => loadFromJsonPayload(decodedData))
+        .catch(err => console.error("Failed to load data from URL parameter", err));
+    } else if (dataParam) {
       try {
         // If we have a data parameter, try to decode and load it
         const decodedData = JSON.parse(decodeURIComponent(dataParam));
@@ -1,5 +1,5 @@
 import React from 'react';
-import { render, screen, fireEvent, waitFor } from '@testing-library/react';
+import { render, screen, fireEvent, waitFor, act } from '@testing-library/react';
 import GraphVisualization from './GraphVisualization';
 import '@testing-library/jest-dom';
 
@@ -139,6 +139,118 @@ describe('GraphVisualization Component', () => {
     });
   });
   
+  test('loads columnar JSON payload through window.loadGraphData', async () => {
+    render(<GraphVisualization />);
+    
+    act(() => {
+      window.loadGraphData({
+        cols: ['Source', 'Target', 'RelationshipType'],
+        data: [['Alice', 'Bob'], ['Bob', 'Charlie'], ['Friend', 'Colleague']]
+      });
+    });
+    
+    await waitFor(() => {
+      expect(screen.getByText('Column Mapping')).toBeInTheDocument();
+    });
+    expect(screen.queryByText(/error/i)).not.toBeInTheDocument();
+  });
+
+  test('loads gzip-compressed payload from the gzdata URL parameter', async () => {
+    // The columnar payload from the loadGraphData test, gzip-compressed and
+    // URL-safe base64 encoded with the "=" padding stripped, as the Python
+    // helper builds it
+    const gzdata = 'H4sIAAAAAAACAx3KMQqAMBBE0btMnRPYqeAB1C5YrLrEhcWVGAsR725MNcPjP1hMT1Qeg11xYTiMFAOnfHpWSmL7uckx3gdjclgpUa49apVSNzZn92Ud2o2iChfpovC-_miqTOHKPL0fgEBgd3EAAAA';
+
+    // jsdom lacks the streams API used to decompress the payload, so stand in
+    // for Blob.stream, DecompressionStream and Response with zlib
+    const zlib = require('zlib');
+    const originals = { Blob: global.Blob, DecompressionStream: global.DecompressionStream, Response: global.Response };
+    global.Blob = class {
+      constructor(parts) {
+        this.bytes = Buffer.concat(parts.map(part => Buffer.from(part)));
+      }
+      stream() {
+        return { pipeThrough: transform => transform.decompress(this.bytes) };
+      }
+    };
+    global.DecompressionStream = class {
+      constructor(format) {
+        expect(format).toBe('gzip');
+      }
+      decompress(bytes) {
+        return zlib.gunzipSync(bytes).toString('utf8');
+      }
+    };
+    global.Response = class {
+      constructor(body) {
+        this.body = body;
+      }
+      text() {
+        return Promise.resolve(this.body);
+      }
+    };
+    const consoleError = jest.spyOn(console, 'error').mockImplementation(() => {});
+    window.history.pushState({}, '', `/?gzdata=${gzdata}`);
+
+    try {
+      render(<GraphVisualization />);
+
+      await waitFor(() => {
+        expect(screen.getByText('Column Mapping')).toBeInTheDocument();
+      });
+      expect(screen.queryByText(/error/i)).not.toBeInTheDocument();
+      expect(consoleError).not.toHaveBeenCalledWith('Failed to load data from URL parameter', expect.anything());
+    } finally {
+      window.history.pushState({}, '', '/');
+      consoleError.mockRestore();
+      Object.assign(global, originals);
+    }
+  });
+
+  test('loads payload fetched from the dataUrl URL parameter', async () => {
+    const dataUrl = 'http://127.0.0.1:8765/abc123';
+    global.fetch.mockImplementationOnce(() =>
+      Promise.resolve({
+        ok: true,
+        json: () => Promise.resolve({
+          cols: ['Source', 'Target', 'RelationshipType'],
+          data: [['Alice', 'Bob'], ['Bob', 'Charlie'], ['Friend', 'Colleague']]
+        })
+      })
+    );
+    window.history.pushState({}, '', `/?dataUrl=${encodeURIComponent(dataUrl)}`);
+
+    try {
+      render(<GraphVisualization />);
+
+      await waitFor(() => {
+        expect(screen.getByText('Column Mapping')).toBeInTheDocument();
+      });
+      expect(global.fetch).toHaveBeenCalledWith(dataUrl);
+      expect(screen.queryByText(/error/i)).not.toBeInTheDocument();
+    } finally {
+      window.history.pushState({}, '', '/');
+    }
+  });
+
+  test('logs an error when the dataUrl payload is no longer available', async () => {
+    global.fetch.mockImplementationOnce(() => Promise.resolve({ ok: false, status: 404 }));
+    const consoleError = jest.spyOn(console, 'error').mockImplementation(() => {});
+    window.history.pushState({}, '', `/?dataUrl=${encodeURIComponent('http://127.0.0.1:8765/expired')}`);
+
+    try {
+      render(<GraphVisualization />);
+
+      await waitFor(() => {
+        expect(consoleError).toHaveBeenCalledWith('Failed to load data from URL parameter', expect.any(Error));
+      });
+      expect(screen.getByText('Upload a data file or load the sample data to visualize relationships.')).toBeInTheDocument();
+    } finally {
+      window.history.pushState({}, '', '/');
+      consoleError.mockRestore();
+    }
+  });
+
   test('shows empty state when no data is loaded', () => {
     render(<GraphVisualization />);
     expect(screen.getByText('Upload a data file or load the sample data to visualize relationships.')).toBeInTheDocument();